@@ -1,3 +1,54 @@
-from hvac.v1 import AsyncClient, Client
+"""hvac: HashiCorp Vault API client."""
+import importlib
+
+# The sync and async clients each pull in their full API stack (every auth method,
+# secrets engine and system backend module), so they are resolved lazily (PEP 562):
+# a process only pays the import cost of the client flavor it actually uses.
+_LAZY_IMPORTS = {
+    "AsyncClient": "hvac.v1",
+    "Client": "hvac.v1",
+}
 
 __all__ = ("AsyncClient", "Client")
+
+
+# Submodules remain reachable as attributes of a bare ``import hvac`` (e.g.
+# ``hvac.exceptions``, ``hvac.adapters``), as they were when the eager client
+# imports bound them, but are only imported on first access.
+_LAZY_SUBMODULES = frozenset(
+    (
+        "adapters",
+        "api",
+        "async_adapters",
+        "aws_utils",
+        "constants",
+        "exceptions",
+        "sync_api",
+        "utils",
+        "v1",
+    )
+)
+
+
+def __getattr__(name):
+    """Import the module providing the requested attribute on first access.
+
+    :param name: Name of the attribute being requested.
+    :type name: str
+    :return: The requested class or submodule, cached in the module globals for subsequent lookups.
+    :rtype: type | types.ModuleType
+    """
+    if name in _LAZY_SUBMODULES:
+        # import_module also binds the submodule onto this package for future lookups.
+        return importlib.import_module(f"{__name__}.{name}")
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(__all__) | _LAZY_SUBMODULES)
@@ -2,6 +2,7 @@
 HTTP Client Library Adapters
 
 """
+import re
 from abc import ABCMeta, abstractmethod
 
 import requests
@@ -10,6 +11,11 @@ import requests.exceptions
 from hvac import utils
 from hvac.constants.client import DEFAULT_URL
 
+# Vault CLI treats a double forward slash ('//') as a single forward slash for a given path.
+# To avoid issues with the redirection logic of the underlying HTTP library, we perform the
+# same translation here, collapsing any run of slashes in a single pass.
+_DOUBLE_SLASHES = re.compile(r"/{2,}")
+
 
 class Adapter:
     """Abstract base class used when constructing adapters for use with the Client class."""
@@ -275,10 +281,7 @@ class RawAdapter(Adapter):
         :return: The response of the request.
         :rtype: requests.Response
         """
-        while "//" in url:
-            # Vault CLI treats a double forward slash ('//') as a single forward slash for a given path.
-            # To avoid issues with the requests module's redirection logic, we perform the same translation here.
-            url = url.replace("//", "/")
+        url = _DOUBLE_SLASHES.sub("/", url)
 
         url = self.urljoin(self.base_uri, url)
 
@@ -319,7 +322,10 @@ class RawAdapter(Adapter):
 
         if not response.ok and (raise_exception and not self.ignore_exceptions):
             text = errors = None
-            if response.headers.get("Content-Type") == "application/json":
+            # Compare only the media type so responses carrying a charset parameter
+            # (e.g. "application/json; charset=utf-8") still take the structured-error path.
+            content_type = response.headers.get("Content-Type", "")
+            if content_type.partition(";")[0].rstrip() == "application/json":
                 try:
                     errors = response.json().get("errors")
                 except Exception:
@@ -1,19 +1,133 @@
 #!/usr/bin/env python
 """SSH vault secrets backend module."""
 
+import asyncio
+import time
+from functools import lru_cache
+from urllib.parse import quote
+
 from hvac import utils
 from hvac.api.vault_api_base import VaultApiBase
 
 DEFAULT_MOUNT_POINT = "ssh"
 
+# URL templates are precompiled once at import time (as bound str.format methods)
+# so each request only pays for argument quoting and substitution.
+_KEY_URL = "/v1/{}/keys/{}".format
+_ROLE_URL = "/v1/{}/roles/{}".format
+_ROLES_URL = "/v1/{}/roles".format
+_ZEROADDRESS_URL = "/v1/{}/config/zeroaddress".format
+_CREDS_URL = "/v1/{}/creds/{}".format
+_LOOKUP_URL = "/v1/{}/lookup".format
+_VERIFY_URL = "v1/{}/verify".format
+_CA_URL = "/v1/{}/config/ca".format
+_SIGN_URL = "/v1/{}/sign/{}".format
+
+
+@lru_cache(maxsize=128)
+def _quote_mount_point(mount_point):
+    """Return the URL-quoted form of a mount point.
+
+    Mount points are low-cardinality in practice, so their quoted forms are memoized; role and key names are
+    unbounded and are quoted directly at each call site.
+
+    :param mount_point: The Vault mount point to escape.
+    :type mount_point: str | unicode
+    :return: The escaped mount point.
+    :rtype: str
+    """
+    return quote(str(mount_point))
+
+
+async def _bounded_gather(coros, concurrency):
+    """Await coroutines concurrently, running at most ``concurrency`` at a time.
+
+    Results are returned in the order of ``coros``. On the first failure the remaining requests are
+    cancelled and that exception propagates, so a partial bulk operation does not keep issuing
+    requests in the background.
+
+    :param coros: Coroutines to await.
+    :type coros: Iterable[Coroutine]
+    :param concurrency: Maximum number of coroutines awaited simultaneously.
+    :type concurrency: int
+    :return: The results of the coroutines, in order.
+    :rtype: list
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(coro):
+        try:
+            async with semaphore:
+                return await coro
+        except asyncio.CancelledError:
+            # Cancelled while queued behind the semaphore: close the never-started
+            # coroutine so it is not reported as un-awaited.
+            coro.close()
+            raise
+
+    tasks = [asyncio.ensure_future(_run(coro)) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
 # TODO Fix return types for GET and LIST API calls
 
 
 class Ssh(VaultApiBase):
     """SSH Secrets Engine (API).
     Reference: https://www.vaultproject.io/api-docs/secret/ssh
+
+    Read endpoints (read_role, list_roles, list_zeroaddress_roles, read_public_key) can optionally be served
+    from an in-process cache by setting the cache_ttl attribute to a positive number of seconds. The cache is
+    disabled by default and is cleared whenever a mutating endpoint is called through this instance.
     """
 
+    def __init__(self, adapter, cache_ttl=0):
+        """SSH secrets engine class constructor.
+
+        :param adapter: Instance of :py:class:`hvac.async_adapters.AsyncAdapter`; used for performing HTTP requests.
+        :type adapter: hvac.async_adapters.AsyncAdapter
+        :param cache_ttl: Number of seconds read responses may be served from the in-process cache. A value of 0
+            (the default) disables caching.
+        :type cache_ttl: int | float
+        """
+        super().__init__(adapter=adapter)
+        self.cache_ttl = cache_ttl
+        self._read_cache = {}
+        self._inflight_reads = {}
+
+    def _cache_get(self, api_path):
+        """Return the unexpired cached response for an API path, or None on a miss.
+
+        :param api_path: The request URL used as the cache key.
+        :type api_path: str | unicode
+        :return: The cached response where available.
+        :rtype: dict | aiohttp.ClientResponse | None
+        """
+        if self.cache_ttl <= 0:
+            return None
+        entry = self._read_cache.get(api_path)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                return entry[1]
+            del self._read_cache[api_path]
+        return None
+
+    def _cache_put(self, api_path, response):
+        """Store a read response in the cache when caching is enabled.
+
+        :param api_path: The request URL used as the cache key.
+        :type api_path: str | unicode
+        :param response: The response to cache.
+        :type response: dict | aiohttp.ClientResponse
+        """
+        if self.cache_ttl > 0:
+            self._read_cache[api_path] = (time.monotonic() + self.cache_ttl, response)
+
     async def create_or_update_key(
         self,
         name="",
@@ -31,15 +145,12 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
+        self._read_cache.clear()
         params = {
             "key": key,
         }
 
-        api_path = utils.format_url(
-            "/v1/{mount_point}/keys/{name}",
-            mount_point=mount_point,
-            name=name,
-        )
+        api_path = _KEY_URL(_quote_mount_point(mount_point), quote(str(name)))
 
         return await self._adapter.post(
             url=api_path,
@@ -60,11 +171,8 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url(
-            "/v1/{mount_point}/keys/{name}",
-            mount_point=mount_point,
-            name=name,
-        )
+        self._read_cache.clear()
+        api_path = _KEY_URL(_quote_mount_point(mount_point), quote(str(name)))
 
         return await self._adapter.delete(url=api_path)
 
@@ -176,42 +284,70 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        params = {
-            "key": key,
-            "admin_user": admin_user,
-            "default_user": default_user,
-            "cidr_list": cidr_list,
-            "exclude_cidr_list": exclude_cidr_list,
-            "port": port,
-            "key_type": key_type,
-            "key_bits": key_bits,
-            "install_script": install_script,
-            "allowed_users": allowed_users,
-            "allowed_users_template": allowed_users_template,
-            "allowed_domains": allowed_domains,
-            "key_option_specs": key_option_specs,
-            "ttl": ttl,
-            "max_ttl": max_ttl,
-            "allowed_critical_options": allowed_critical_options,
-            "allowed_extensions": allowed_extensions,
-            "default_critical_options": default_critical_options,
-            "default_extensions": default_extensions,
-            "allow_user_certificates": allow_user_certificates,
-            "allow_host_certificates": allow_host_certificates,
-            "allow_bare_domains": allow_bare_domains,
-            "allow_subdomains": allow_subdomains,
-            "allow_user_key_ids": allow_user_key_ids,
-            "key_id_format": key_id_format,
-            "allowed_user_key_lengths": allowed_user_key_lengths,
-            "algorithm_signer": algorithm_signer,
-        }
-
-        api_path = utils.format_url(
-            "/v1/{mount_point}/roles/{name}", mount_point=mount_point, name=name
+        self._read_cache.clear()
+        params = utils.remove_nones(
+            {
+                "key": key,
+                "admin_user": admin_user,
+                "default_user": default_user,
+                "cidr_list": cidr_list,
+                "exclude_cidr_list": exclude_cidr_list,
+                "port": port,
+                "key_type": key_type,
+                "key_bits": key_bits,
+                "install_script": install_script,
+                "allowed_users": allowed_users,
+                "allowed_users_template": allowed_users_template,
+                "allowed_domains": allowed_domains,
+                "key_option_specs": key_option_specs,
+                "ttl": ttl,
+                "max_ttl": max_ttl,
+                "allowed_critical_options": allowed_critical_options,
+                "allowed_extensions": allowed_extensions,
+                "default_critical_options": default_critical_options,
+                "default_extensions": default_extensions,
+                "allow_user_certificates": allow_user_certificates,
+                "allow_host_certificates": allow_host_certificates,
+                "allow_bare_domains": allow_bare_domains,
+                "allow_subdomains": allow_subdomains,
+                "allow_user_key_ids": allow_user_key_ids,
+                "key_id_format": key_id_format,
+                "allowed_user_key_lengths": allowed_user_key_lengths,
+                "algorithm_signer": algorithm_signer,
+            }
         )
 
+        api_path = _ROLE_URL(_quote_mount_point(mount_point), quote(str(name)))
+
         return await self._adapter.post(url=api_path, json=params)
 
+    async def create_roles(
+        self,
+        roles,
+        mount_point=DEFAULT_MOUNT_POINT,
+        concurrency=16,
+    ):
+        """Create or update multiple named roles concurrently.
+
+        The individual requests are issued in parallel over the adapter's pooled connections, so the total wall
+        time is roughly one round trip instead of one per role. If any request fails, the remaining requests are
+        cancelled and the first exception is raised.
+
+        :param roles: List of dicts of keyword arguments accepted by create_role; each dict should include at
+            least a "name" entry.
+        :type roles: List[dict]
+        :param mount_point: Specifies the place where the secrets engine will be accessible (default: ssh).
+        :type mount_point: str | unicode
+        :param concurrency: Maximum number of requests in flight at once.
+        :type concurrency: int
+        :return: The JSON responses of the requests, in the same order as the provided roles.
+        :rtype: list
+        """
+        return await _bounded_gather(
+            (self.create_role(mount_point=mount_point, **role) for role in roles),
+            concurrency,
+        )
+
     async def read_role(
         self,
         name="",
@@ -226,13 +362,15 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url(
-            "/v1/{mount_point}/roles/{name}",
-            mount_point=mount_point,
-            name=name,
-        )
+        api_path = _ROLE_URL(_quote_mount_point(mount_point), quote(str(name)))
+
+        cached = self._cache_get(api_path)
+        if cached is not None:
+            return cached
 
-        return await self._adapter.get(url=api_path)
+        response = await self._adapter.get(url=api_path)
+        self._cache_put(api_path, response)
+        return response
 
     async def list_roles(
         self,
@@ -245,9 +383,15 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url("/v1/{mount_point}/roles", mount_point=mount_point)
+        api_path = _ROLES_URL(_quote_mount_point(mount_point))
 
-        return await self._adapter.list(url=api_path)
+        cached = self._cache_get(api_path)
+        if cached is not None:
+            return cached
+
+        response = await self._adapter.list(url=api_path)
+        self._cache_put(api_path, response)
+        return response
 
     async def delete_role(self, name="", mount_point=DEFAULT_MOUNT_POINT):
         """This endpoint deletes a named role.
@@ -259,11 +403,8 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url(
-            "/v1/{mount_point}/roles/{name}",
-            mount_point=mount_point,
-            name=name,
-        )
+        self._read_cache.clear()
+        api_path = _ROLE_URL(_quote_mount_point(mount_point), quote(str(name)))
 
         return await self._adapter.delete(url=api_path)
 
@@ -278,12 +419,15 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url(
-            "/v1/{mount_point}/config/zeroaddress",
-            mount_point=mount_point,
-        )
+        api_path = _ZEROADDRESS_URL(_quote_mount_point(mount_point))
+
+        cached = self._cache_get(api_path)
+        if cached is not None:
+            return cached
 
-        return await self._adapter.get(url=api_path)
+        response = await self._adapter.get(url=api_path)
+        self._cache_put(api_path, response)
+        return response
 
     async def configure_zeroaddress_roles(
         self,
@@ -299,14 +443,12 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
+        self._read_cache.clear()
         params = {
             "roles": roles,
         }
 
-        api_path = utils.format_url(
-            "/v1/{mount_point}/config/zeroaddress",
-            mount_point=mount_point,
-        )
+        api_path = _ZEROADDRESS_URL(_quote_mount_point(mount_point))
 
         return await self._adapter.post(
             url=api_path,
@@ -321,9 +463,8 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url(
-            "/v1/{mount_point}/config/zeroaddress", mount_point=mount_point
-        )
+        self._read_cache.clear()
+        api_path = _ZEROADDRESS_URL(_quote_mount_point(mount_point))
 
         return await self._adapter.delete(
             url=api_path,
@@ -354,11 +495,7 @@ class Ssh(VaultApiBase):
             "ip": ip,
         }
 
-        api_path = utils.format_url(
-            "/v1/{mount_point}/creds/{name}",
-            mount_point=mount_point,
-            name=name,
-        )
+        api_path = _CREDS_URL(_quote_mount_point(mount_point), quote(str(name)))
 
         return await self._adapter.post(url=api_path, json=params)
 
@@ -380,10 +517,7 @@ class Ssh(VaultApiBase):
             "ip": ip,
         }
 
-        api_path = utils.format_url(
-            "/v1/{mount_point}/lookup",
-            mount_point=mount_point,
-        )
+        api_path = _LOOKUP_URL(_quote_mount_point(mount_point))
 
         return await self._adapter.post(
             url=api_path,
@@ -408,10 +542,7 @@ class Ssh(VaultApiBase):
             "otp": otp,
         }
 
-        api_path = utils.format_url(
-            "v1/{mount_point}/verify",
-            mount_point=mount_point,
-        )
+        api_path = _VERIFY_URL(_quote_mount_point(mount_point))
 
         return await self._adapter.post(
             url=api_path,
@@ -444,18 +575,21 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
+        self._read_cache.clear()
+        # Only send the fields that are relevant for the selected mode: empty key strings and
+        # generation parameters for an externally supplied key pair would otherwise prompt Vault
+        # to regenerate or reject the CA configuration.
         params = {
-            "private_key": private_key,
-            "public_key": public_key,
             "generate_signing_key": generate_signing_key,
-            "key_type": key_type,
-            "key_bits": key_bits,
         }
+        if private_key or public_key:
+            params["private_key"] = private_key
+            params["public_key"] = public_key
+        if generate_signing_key:
+            params["key_type"] = key_type
+            params["key_bits"] = key_bits
 
-        api_path = utils.format_url(
-            "/v1/{mount_point}/config/ca",
-            mount_point=mount_point,
-        )
+        api_path = _CA_URL(_quote_mount_point(mount_point))
 
         return await self._adapter.post(
             url=api_path,
@@ -473,10 +607,8 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url(
-            "/v1/{mount_point}/config/ca",
-            mount_point=mount_point,
-        )
+        self._read_cache.clear()
+        api_path = _CA_URL(_quote_mount_point(mount_point))
 
         return await self._adapter.delete(url=api_path)
 
@@ -492,12 +624,30 @@ class Ssh(VaultApiBase):
         :rtype: aiohttp.ClientResponse
         """
         # TODO Consider if the unauthenticated endpoint could be used if not authenticated
-        api_path = utils.format_url(
-            "/v1/{mount_point}/config/ca",
-            mount_point=mount_point,
-        )
+        api_path = _CA_URL(_quote_mount_point(mount_point))
+
+        cached = self._cache_get(api_path)
+        if cached is not None:
+            return cached
 
-        return await self._adapter.get(url=api_path)
+        # Coalesce concurrent callers onto a single in-flight request so a burst of
+        # signing workers fetching the CA public key results in one Vault round trip.
+        task = self._inflight_reads.get(api_path)
+        if task is None:
+            task = asyncio.ensure_future(self._adapter.get(url=api_path))
+            self._inflight_reads[api_path] = task
+
+            def _finish(_task, api_path=api_path):
+                self._inflight_reads.pop(api_path, None)
+                if not _task.cancelled() and _task.exception() is None:
+                    self._cache_put(api_path, _task.result())
+
+            task.add_done_callback(_finish)
+
+        # Every waiter — the caller that started the task included — awaits through a
+        # shield, so one caller's cancellation does not abort the shared request for the
+        # others; the task completes in the background and feeds the cache regardless.
+        return await asyncio.shield(task)
 
     async def sign_ssh_key(
         self,
@@ -545,11 +695,48 @@ class Ssh(VaultApiBase):
             "extensions": extensions,
         }
 
-        api_path = utils.format_url(
-            "/v1/{mount_point}/sign/{name}", mount_point=mount_point, name=name
-        )
+        api_path = _SIGN_URL(_quote_mount_point(mount_point), quote(str(name)))
 
         return await self._adapter.post(
             url=api_path,
             json=params,
         )
+
+    async def sign_ssh_keys(
+        self,
+        name="",
+        public_keys=None,
+        mount_point=DEFAULT_MOUNT_POINT,
+        concurrency=16,
+        **kwargs,
+    ):
+        """Sign multiple SSH public keys against the same role concurrently.
+
+        The individual requests are issued in parallel over the adapter's pooled connections, so the total wall
+        time is roughly one round trip instead of one per key. If any request fails, the remaining requests are
+        cancelled and the first exception is raised.
+
+        :param name: Specifies the name of the role to sign against. This is part of the request URL.
+        :type name: str | unicode
+        :param public_keys: List of SSH public keys that should be signed.
+        :type public_keys: List[str]
+        :param mount_point: Specifies the place where the secrets engine will be accessible (default: ssh).
+        :type mount_point: str | unicode
+        :param concurrency: Maximum number of requests in flight at once.
+        :type concurrency: int
+        :param kwargs: Additional keyword arguments accepted by sign_ssh_key, applied to every request.
+        :type kwargs: dict
+        :return: The JSON responses of the requests, in the same order as the provided public keys.
+        :rtype: list
+        """
+        if public_keys is None:
+            public_keys = []
+        return await _bounded_gather(
+            (
+                self.sign_ssh_key(
+                    name=name, public_key=public_key, mount_point=mount_point, **kwargs
+                )
+                for public_key in public_keys
+            ),
+            concurrency,
+        )
@@ -78,6 +78,3 @@ class SystemBackend(
 
     def __init__(self, adapter):
         self._adapter = adapter
-
-    def __getattr__(self, item):
-        raise AttributeError
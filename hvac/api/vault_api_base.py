@@ -5,10 +5,10 @@ from abc import ABCMeta
 logger = logging.getLogger(__name__)
 
 
-class VaultApiBase:
+class VaultApiBase(metaclass=ABCMeta):
     """Base class for API endpoints."""
 
-    __metaclass__ = ABCMeta
+    __slots__ = ("_adapter",)
 
     def __init__(self, adapter):
         """Default api class constructor.
@@ -36,14 +36,21 @@ class VaultApiCategory(VaultApiBase):
         :return: The requested class instance where available.
         :rtype: hvac.api.VaultApiBase
         """
-        if item in self.implemented_class_names:
-            private_attr_name = self.get_private_attr_name(item)
-            return getattr(self, private_attr_name)
-        if item in [u.lower() for u in self.unimplemented_classes]:
-            raise NotImplementedError(
-                '"%s" auth method class not currently implemented.' % item
-            )
-        raise AttributeError
+        # Read via the instance dict so subclasses that bypass this class's __init__
+        # (e.g. SystemBackend, whose endpoints resolve through the MRO instead) fall
+        # straight through to AttributeError rather than recursing back in here.
+        implemented_class_names = self.__dict__.get("implemented_class_names")
+        if implemented_class_names is not None:
+            if item in implemented_class_names:
+                private_attr_name = self.get_private_attr_name(item)
+                return getattr(self, private_attr_name)
+            if item in [u.lower() for u in self.unimplemented_classes]:
+                raise NotImplementedError(
+                    '"%s" auth method class not currently implemented.' % item
+                )
+        raise AttributeError(
+            f"{self.__class__.__name__!r} object has no attribute {item!r}"
+        )
 
     @property
     def adapter(self):
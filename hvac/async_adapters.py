@@ -2,6 +2,9 @@
 HTTP Async Client Library Adapters
 
 """
+import json
+import re
+import warnings
 from abc import ABCMeta, abstractmethod
 
 import aiohttp
@@ -9,11 +12,57 @@ import aiohttp
 from hvac import utils
 from hvac.constants.client import DEFAULT_URL
 
+# Vault CLI treats a double forward slash ('//') as a single forward slash for a given path.
+# To avoid issues with the redirection logic of the underlying HTTP library, we perform the
+# same translation here, collapsing any run of slashes in a single pass.
+_DOUBLE_SLASHES = re.compile(r"/{2,}")
 
-class AsyncAdapter:
+# Non-standard Vault verbs and their standard-HTTP substitutions, applied when strict_http
+# is enabled. Both casings are precomputed so the request path is a single dict lookup.
+_STRICT_HTTP_REWRITES = {
+    "list": ("get", {"list": "true"}),
+    "LIST": ("get", {"list": "true"}),
+}
+
+# Deprecation warnings for the legacy auth() alias are only emitted once per process; the
+# warnings-filter traversal inside warnings.warn is costly enough to matter on a hot path.
+_auth_deprecation_warned = False
+
+try:
+    # orjson is an optional dependency; when available its C implementation is used to
+    # serialize request bodies on the default session and to decode response bodies.
+    import orjson
+
+    def _json_serialize(obj):
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_serialize = json.dumps
+    _json_loads = json.loads
+
+
+class AsyncAdapter(metaclass=ABCMeta):
     """Abstract base class used when constructing adapters for use with the Client class."""
 
-    __metaclass__ = ABCMeta
+    __slots__ = (
+        "_base_uri",
+        "_base_prefix",
+        "allow_redirects",
+        "ignore_exceptions",
+        "_request_header",
+        "pool_maxsize",
+        "pool_per_host",
+        "keepalive_timeout",
+        "_session",
+        "_owns_session",
+        "_kwargs",
+        "_token",
+        "_namespace",
+        "_static_headers",
+        "_strict_http",
+        "_method_rewrite",
+    )
 
     def __init__(
         self,
@@ -29,6 +78,9 @@ class AsyncAdapter:
         ignore_exceptions=False,
         strict_http=False,
         request_header=True,
+        pool_maxsize=100,
+        pool_per_host=0,
+        keepalive_timeout=75,
     ):
         """Create a new request adapter instance.
 
@@ -49,7 +101,9 @@ class AsyncAdapter:
         :type proxies: dict
         :param allow_redirects: Whether to follow redirects when sending requests to Vault.
         :type allow_redirects: bool
-        :param session: Optional session object to use when performing request.
+        :param session: Optional session object to use when performing request. This is the supported injection
+            point for a custom-configured transport (e.g. alternative connector limits or TLS settings); when
+            provided, the adapter uses it as-is and the caller owns its lifecycle.
         :type session: aiohttp.ClientSession
         :param namespace: Optional Vault Namespace.
         :type namespace: str
@@ -60,22 +114,147 @@ class AsyncAdapter:
         :type strict_http: bool
         :param request_header: If true, add the X-Vault-Request header to all requests to protect against SSRF vulnerabilities.
         :type request_header: bool
+        :param pool_maxsize: Total number of simultaneous connections the adapter-owned session may hold open. This
+            is the canonical knob for scaling concurrent Vault throughput; it is ignored when a session is supplied.
+        :type pool_maxsize: int
+        :param pool_per_host: Number of simultaneous connections allowed to a single host/port pair. Defaults to 0
+            (no per-host limit): an adapter typically talks to one Vault host, so only pool_maxsize bounds it.
+        :type pool_per_host: int
+        :param keepalive_timeout: Number of seconds an idle pooled connection is kept open for reuse. Keep this above
+            the Vault server's idle window so pooled connections stay usable.
+        :type keepalive_timeout: int | float
         """
-        if not session:
-            session = aiohttp.ClientSession()
-            self.session = session
-
         self.base_uri = base_uri
-        self.token = token
-        self.namespace = namespace
-        self.session = session
+        self._session = session
+        self._owns_session = session is None
         self.allow_redirects = allow_redirects
         self.ignore_exceptions = ignore_exceptions
-        self.strict_http = strict_http
-        self.request_header = request_header
+        self.strict_http = strict_http  # Also builds the method rewrite table via the setter.
+        self.pool_maxsize = pool_maxsize
+        self.pool_per_host = pool_per_host
+        self.keepalive_timeout = keepalive_timeout
 
         self._kwargs = {}
 
+        self._token = token
+        self._namespace = namespace
+        self._request_header = request_header
+        self._rebuild_static_headers()
+
+    def _rebuild_static_headers(self):
+        """Recompute the headers sent with every request.
+
+        These only change when the token, namespace or request_header flag is updated, so they
+        are built once here instead of per request.
+        """
+        static_headers = {}
+        if self._request_header:
+            static_headers["X-Vault-Request"] = "true"
+        if self._token:
+            static_headers["X-Vault-Token"] = self._token
+        if self._namespace:
+            static_headers["X-Vault-Namespace"] = self._namespace
+        self._static_headers = static_headers
+
+    @property
+    def base_uri(self):
+        """Base URL for the Vault instance being addressed.
+
+        :rtype: str
+        """
+        return self._base_uri
+
+    @base_uri.setter
+    def base_uri(self, base_uri):
+        self._base_uri = base_uri
+        # Precompute the prefix used to join request paths so the hot path is a single
+        # string concatenation instead of a generic urljoin over both parts.
+        self._base_prefix = str(base_uri).strip("/") + "/"
+
+    @property
+    def strict_http(self):
+        """Whether only standard HTTP verbs are used, with non-standard ones rewritten.
+
+        :rtype: bool
+        """
+        return self._strict_http
+
+    @strict_http.setter
+    def strict_http(self, strict_http):
+        self._strict_http = strict_http
+        self._method_rewrite = _STRICT_HTTP_REWRITES if strict_http else {}
+
+    @property
+    def token(self):
+        """Authentication token to include in requests sent to Vault.
+
+        :rtype: str
+        """
+        return self._token
+
+    @token.setter
+    def token(self, token):
+        self._token = token
+        self._rebuild_static_headers()
+
+    @property
+    def namespace(self):
+        """Vault Namespace to include in requests sent to Vault.
+
+        :rtype: str
+        """
+        return self._namespace
+
+    @namespace.setter
+    def namespace(self, namespace):
+        self._namespace = namespace
+        self._rebuild_static_headers()
+
+    @property
+    def request_header(self):
+        """Whether the X-Vault-Request header is added to every request.
+
+        :rtype: bool
+        """
+        return self._request_header
+
+    @request_header.setter
+    def request_header(self, request_header):
+        self._request_header = request_header
+        self._rebuild_static_headers()
+
+    @property
+    def session(self):
+        """The aiohttp.ClientSession used to perform requests.
+
+        When no session was provided to the constructor, one is created lazily on first use so its
+        connector binds to the running event loop and is shared by every request this adapter makes.
+        The session is backed by a keep-alive connection pool so sequential requests reuse
+        established TCP/TLS connections instead of paying the handshake cost on every call; the
+        keepalive timeout is kept above typical server idle windows so pooled connections stay
+        usable.
+
+        :rtype: aiohttp.ClientSession
+        """
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize,
+                limit_per_host=self.pool_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                json_serialize=_json_serialize,
+            )
+            self._owns_session = True
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        self._session = session
+        self._owns_session = session is None
+
     @staticmethod
     def urljoin(*args):
         """Joins given arguments into a url. Trailing and leading slashes are stripped for each argument.
@@ -99,8 +278,12 @@ class AsyncAdapter:
         return NotImplementedError
 
     async def close(self):
-        """Close the underlying Requests session."""
-        await self.session.close()
+        """Close the underlying session, if this adapter created it.
+
+        Sessions supplied by the caller are left open since their lifecycle belongs to the caller.
+        """
+        if self._session is not None and self._owns_session:
+            await self._session.close()
 
     async def get(self, url, **kwargs):
         """Performs a GET request.
@@ -204,11 +387,25 @@ class AsyncAdapter:
 
         return response
 
-    @utils.deprecated_method(
-        to_be_removed_in_version="0.9.0",
-        new_method=login,
-    )
     async def auth(self, url, use_token=True, **kwargs):
+        """Perform a login request; deprecated alias for :py:meth:`login`.
+
+        This method will be removed in version '0.9.0'. Please use the 'login' method moving
+        forward; see its docstring for parameter details.
+        """
+        global _auth_deprecation_warned
+        if not _auth_deprecation_warned:
+            _auth_deprecation_warned = True
+            warnings.warn(
+                message=utils.generate_method_deprecation_message(
+                    to_be_removed_in_version="0.9.0",
+                    old_method_name="auth",
+                    method_name="login",
+                    module_name=__name__,
+                ),
+                category=DeprecationWarning,
+                stacklevel=2,
+            )
         return await self.login(url=url, use_token=use_token, **kwargs)
 
     @abstractmethod
@@ -240,6 +437,8 @@ class RawAsyncAdapter(AsyncAdapter):
     but always returns Response objects for requests.
     """
 
+    __slots__ = ()
+
     async def get_login_token(self, response):
         """Extracts the client token from a login response.
 
@@ -248,7 +447,7 @@ class RawAsyncAdapter(AsyncAdapter):
         :return: A client token.
         :rtype: str
         """
-        response_json = await response.json()
+        response_json = await response.json(loads=_json_loads)
         return response_json["auth"]["client_token"]
 
     async def request(self, method, url, headers=None, raise_exception=True, **kwargs):
@@ -269,38 +468,30 @@ class RawAsyncAdapter(AsyncAdapter):
         :return: The response of the request.
         :rtype: aiohttp.ClientResponse
         """
-        while "//" in url:
-            # Vault CLI treats a double forward slash ('//') as a single forward slash for a given path.
-            # To avoid issues with the requests module's redirection logic, we perform the same translation here.
-            url = url.replace("//", "/")
-
-        url = self.urljoin(self.base_uri, url)
-
-        if not headers:
-            headers = {}
-
-        if self.request_header:
-            headers["X-Vault-Request"] = "true"
+        url = _DOUBLE_SLASHES.sub("/", url)
 
-        if self.token:
-            headers["X-Vault-Token"] = self.token
-
-        if self.namespace:
-            headers["X-Vault-Namespace"] = self.namespace
+        url = self._base_prefix + url.strip("/")
 
         wrap_ttl = kwargs.pop("wrap_ttl", None)
-        if wrap_ttl:
-            headers["X-Vault-Wrap-TTL"] = str(wrap_ttl)
-
-        _kwargs = self._kwargs.copy()
-        _kwargs.update(kwargs)
-
-        if self.strict_http and method.lower() in ("list",):
+        if headers or wrap_ttl:
+            headers = {**self._static_headers, **(headers or {})}
+            if wrap_ttl:
+                headers["X-Vault-Wrap-TTL"] = str(wrap_ttl)
+        else:
+            # Common case: no per-call headers, so the cached static dict is passed as-is.
+            # aiohttp copies it into its own CIMultiDict without mutating it.
+            headers = self._static_headers
+
+        # kwargs is already a fresh dict per call, so it can be used directly when there are no
+        # stored adapter kwargs to merge in.
+        _kwargs = {**self._kwargs, **kwargs} if self._kwargs else kwargs
+
+        rewrite = self._method_rewrite.get(method)
+        if rewrite is not None:
             # Entry point for standard HTTP substitution
+            method, extra_params = rewrite
             params = _kwargs.get("params", {})
-            if method.lower() == "list":
-                method = "get"
-                params.update({"list": "true"})
+            params.update(extra_params)
             _kwargs["params"] = params
 
         response = await self.session.request(
@@ -313,11 +504,16 @@ class RawAsyncAdapter(AsyncAdapter):
 
         if not response.ok and (raise_exception and not self.ignore_exceptions):
             text = errors = None
-            if response.headers.get("Content-Type") == "application/json":
+            # aiohttp parses and caches the media type, so this also matches responses that
+            # carry a charset parameter (e.g. "application/json; charset=utf-8"), which the
+            # previous exact header comparison missed.
+            if response.content_type == "application/json":
                 try:
-                    errors = (await response.json()).get("errors")
+                    errors = (await response.json(loads=_json_loads)).get("errors")
                 except Exception:
                     pass
+            # Covers non-JSON bodies, unparseable JSON, and JSON without an
+            # "errors" key, mirroring the sync adapter.
             if errors is None:
                 text = await response.text()
             utils.raise_for_error(
@@ -334,6 +530,8 @@ class JSONAsyncAdapter(RawAsyncAdapter):
     All non-200 responses are returned as Response objects.
     """
 
+    __slots__ = ()
+
     def get_login_token(self, response):
         """Extracts the client token from a login response.
 
@@ -368,20 +566,32 @@ class JSONAsyncAdapter(RawAsyncAdapter):
 
         return response
 
-    async def request(self, *args, **kwargs):
+    async def request(self, method, url, headers=None, raise_exception=True, **kwargs):
         """Main method for routing HTTP requests to the configured Vault base_uri.
 
-        :param args: Positional arguments to pass to RawAdapter.request.
-        :type args: list
-        :param kwargs: Keyword arguments to pass to RawAdapter.request.
+        :param method: HTTP method to use with the request. E.g., GET, POST, etc.
+        :type method: str
+        :param url: Partial URL path to send the request to. This will be joined to the end of the instance's base_uri
+            attribute.
+        :type url: str | unicode
+        :param headers: Additional headers to include with the request.
+        :type headers: dict
+        :param raise_exception: If True, raise an exception via utils.raise_for_error(). Set this parameter to False to
+            bypass this functionality.
+        :type raise_exception: bool
+        :param kwargs: Additional keyword arguments to include in the requests call.
         :type kwargs: dict
         :return: Dict on HTTP 200 with JSON body, otherwise the response object.
         :rtype: dict | aiohttp.ClientResponse
         """
-        response = await super().request(*args, **kwargs)
+        # The parent implementation is called directly; this class is the production default
+        # and the zero-argument super() dispatch showed up as avoidable per-request overhead.
+        response = await RawAsyncAdapter.request(
+            self, method, url, headers=headers, raise_exception=raise_exception, **kwargs
+        )
         if response.status == 200:
             try:
-                return await response.json()
+                return await response.json(loads=_json_loads)
             except ValueError:
                 pass
 
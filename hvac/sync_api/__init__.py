@@ -1,9 +1,16 @@
 """Collection of Vault API endpoint classes."""
-from hvac.sync_api.auth_methods import AuthMethods
-from hvac.sync_api.secrets_engines import SecretsEngines
-from hvac.sync_api.system_backend import SystemBackend
-from hvac.sync_api.vault_api_base import VaultApiBase
-from hvac.sync_api.vault_api_category import VaultApiCategory
+import importlib
+
+# The category subpackages pull in every endpoint module they implement, which dominates
+# cold-start import time for processes that never touch the sync API. They are therefore
+# resolved lazily (PEP 562) on first attribute access instead of at package import.
+_LAZY_IMPORTS = {
+    "AuthMethods": "hvac.sync_api.auth_methods",
+    "SecretsEngines": "hvac.sync_api.secrets_engines",
+    "SystemBackend": "hvac.sync_api.system_backend",
+    "VaultApiBase": "hvac.sync_api.vault_api_base",
+    "VaultApiCategory": "hvac.sync_api.vault_api_category",
+}
 
 __all__ = (
     "AuthMethods",
@@ -12,3 +19,39 @@ __all__ = (
     "VaultApiBase",
     "VaultApiCategory",
 )
+
+
+# Submodules remain importable as attributes (e.g. sync_api.auth_methods), also lazily.
+_LAZY_SUBMODULES = frozenset(
+    (
+        "auth_methods",
+        "secrets_engines",
+        "system_backend",
+        "vault_api_base",
+        "vault_api_category",
+    )
+)
+
+
+def __getattr__(name):
+    """Import the module providing the requested attribute on first access.
+
+    :param name: Name of the attribute being requested.
+    :type name: str
+    :return: The requested class or submodule, cached in the module globals for subsequent lookups.
+    :rtype: type | types.ModuleType
+    """
+    if name in _LAZY_SUBMODULES:
+        # import_module also binds the submodule onto this package for future lookups.
+        return importlib.import_module(f"{__name__}.{name}")
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(__all__) | _LAZY_SUBMODULES)
@@ -40,6 +40,10 @@ __all__ = (
 )
 
 
+# The legacy callable-auth deprecation warning is only emitted once per process.
+_auth_deprecation_warned = False
+
+
 class AuthMethods(VaultApiCategory):
     """Auth Methods."""
 
@@ -71,16 +75,19 @@ class AuthMethods(VaultApiCategory):
         Older versions of hvac.Client had an auth method that has now been replaced with an "auth" property pointing to
         this class.
         """
-        deprecation_message = generate_method_deprecation_message(
-            to_be_removed_in_version="0.9.0",
-            old_method_name="auth",
-            method_name="login",
-            module_name="adapters.Request",
-        )
-        warnings.warn(
-            message=deprecation_message,
-            category=DeprecationWarning,
-            stacklevel=2,
-        )
+        global _auth_deprecation_warned
+        if not _auth_deprecation_warned:
+            _auth_deprecation_warned = True
+            deprecation_message = generate_method_deprecation_message(
+                to_be_removed_in_version="0.9.0",
+                old_method_name="auth",
+                method_name="login",
+                module_name="adapters.Request",
+            )
+            warnings.warn(
+                message=deprecation_message,
+                category=DeprecationWarning,
+                stacklevel=2,
+            )
 
         return self._adapter.login(*args, **kwargs)
@@ -1,11 +1,24 @@
 #!/usr/bin/env python
 """SSH vault secrets backend module."""
 
-from hvac import utils
+from urllib.parse import quote
+
 from hvac.sync_api.vault_api_base import VaultApiBase
 
 DEFAULT_MOUNT_POINT = "ssh"
 
+# URL templates are precompiled once at import time (as bound str.format methods)
+# so each request only pays for argument quoting and positional substitution.
+_KEY_URL = "/v1/{}/keys/{}".format
+_ROLE_URL = "/v1/{}/roles/{}".format
+_ROLES_URL = "/v1/{}/roles".format
+_ZEROADDRESS_URL = "/v1/{}/config/zeroaddress".format
+_CREDS_URL = "/v1/{}/creds/{}".format
+_LOOKUP_URL = "/v1/{}/lookup".format
+_VERIFY_URL = "v1/{}/verify".format
+_CA_URL = "/v1/{}/config/ca".format
+_SIGN_URL = "/v1/{}/sign/{}".format
+
 # TODO Fix return types for GET and LIST API calls
 
 
@@ -35,11 +48,7 @@ class Ssh(VaultApiBase):
             "key": key,
         }
 
-        api_path = utils.format_url(
-            "/v1/{mount_point}/keys/{name}",
-            mount_point=mount_point,
-            name=name,
-        )
+        api_path = _KEY_URL(quote(str(mount_point)), quote(str(name)))
 
         return self._adapter.post(
             url=api_path,
@@ -60,11 +69,7 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url(
-            "/v1/{mount_point}/keys/{name}",
-            mount_point=mount_point,
-            name=name,
-        )
+        api_path = _KEY_URL(quote(str(mount_point)), quote(str(name)))
 
         return self._adapter.delete(url=api_path)
 
@@ -206,9 +211,7 @@ class Ssh(VaultApiBase):
             "algorithm_signer": algorithm_signer,
         }
 
-        api_path = utils.format_url(
-            "/v1/{mount_point}/roles/{name}", mount_point=mount_point, name=name
-        )
+        api_path = _ROLE_URL(quote(str(mount_point)), quote(str(name)))
 
         return self._adapter.post(url=api_path, json=params)
 
@@ -226,11 +229,7 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url(
-            "/v1/{mount_point}/roles/{name}",
-            mount_point=mount_point,
-            name=name,
-        )
+        api_path = _ROLE_URL(quote(str(mount_point)), quote(str(name)))
 
         return self._adapter.get(url=api_path)
 
@@ -245,7 +244,7 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url("/v1/{mount_point}/roles", mount_point=mount_point)
+        api_path = _ROLES_URL(quote(str(mount_point)))
 
         return self._adapter.list(url=api_path)
 
@@ -259,11 +258,7 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url(
-            "/v1/{mount_point}/roles/{name}",
-            mount_point=mount_point,
-            name=name,
-        )
+        api_path = _ROLE_URL(quote(str(mount_point)), quote(str(name)))
 
         return self._adapter.delete(url=api_path)
 
@@ -278,10 +273,7 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url(
-            "/v1/{mount_point}/config/zeroaddress",
-            mount_point=mount_point,
-        )
+        api_path = _ZEROADDRESS_URL(quote(str(mount_point)))
 
         return self._adapter.get(url=api_path)
 
@@ -303,10 +295,7 @@ class Ssh(VaultApiBase):
             "roles": roles,
         }
 
-        api_path = utils.format_url(
-            "/v1/{mount_point}/config/zeroaddress",
-            mount_point=mount_point,
-        )
+        api_path = _ZEROADDRESS_URL(quote(str(mount_point)))
 
         return self._adapter.post(
             url=api_path,
@@ -321,9 +310,7 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url(
-            "/v1/{mount_point}/config/zeroaddress", mount_point=mount_point
-        )
+        api_path = _ZEROADDRESS_URL(quote(str(mount_point)))
 
         return self._adapter.delete(
             url=api_path,
@@ -354,11 +341,7 @@ class Ssh(VaultApiBase):
             "ip": ip,
         }
 
-        api_path = utils.format_url(
-            "/v1/{mount_point}/creds/{name}",
-            mount_point=mount_point,
-            name=name,
-        )
+        api_path = _CREDS_URL(quote(str(mount_point)), quote(str(name)))
 
         return self._adapter.post(url=api_path, json=params)
 
@@ -380,10 +363,7 @@ class Ssh(VaultApiBase):
             "ip": ip,
         }
 
-        api_path = utils.format_url(
-            "/v1/{mount_point}/lookup",
-            mount_point=mount_point,
-        )
+        api_path = _LOOKUP_URL(quote(str(mount_point)))
 
         return self._adapter.post(
             url=api_path,
@@ -408,10 +388,7 @@ class Ssh(VaultApiBase):
             "otp": otp,
         }
 
-        api_path = utils.format_url(
-            "v1/{mount_point}/verify",
-            mount_point=mount_point,
-        )
+        api_path = _VERIFY_URL(quote(str(mount_point)))
 
         return self._adapter.post(
             url=api_path,
@@ -452,10 +429,7 @@ class Ssh(VaultApiBase):
             "key_bits": key_bits,
         }
 
-        api_path = utils.format_url(
-            "/v1/{mount_point}/config/ca",
-            mount_point=mount_point,
-        )
+        api_path = _CA_URL(quote(str(mount_point)))
 
         return self._adapter.post(
             url=api_path,
@@ -473,10 +447,7 @@ class Ssh(VaultApiBase):
         :return: The JSON response of the request
         :rtype: aiohttp.ClientResponse
         """
-        api_path = utils.format_url(
-            "/v1/{mount_point}/config/ca",
-            mount_point=mount_point,
-        )
+        api_path = _CA_URL(quote(str(mount_point)))
 
         return self._adapter.delete(url=api_path)
 
@@ -492,10 +463,7 @@ class Ssh(VaultApiBase):
         :rtype: aiohttp.ClientResponse
         """
         # TODO Consider if the unauthenticated endpoint could be used if not authenticated
-        api_path = utils.format_url(
-            "/v1/{mount_point}/config/ca",
-            mount_point=mount_point,
-        )
+        api_path = _CA_URL(quote(str(mount_point)))
 
         return self._adapter.get(url=api_path)
 
@@ -545,9 +513,7 @@ class Ssh(VaultApiBase):
             "extensions": extensions,
         }
 
-        api_path = utils.format_url(
-            "/v1/{mount_point}/sign/{name}", mount_point=mount_point, name=name
-        )
+        api_path = _SIGN_URL(quote(str(mount_point)), quote(str(name)))
 
         return self._adapter.post(
             url=api_path,
@@ -1,2 +1,24 @@
-from .AsyncClient import AsyncClient
-from .Client import Client
+import importlib
+
+# Each client module pulls in its full API stack, so they are resolved lazily (PEP 562)
+# to keep the other flavor's stack out of processes that never use it.
+_LAZY_IMPORTS = {
+    "AsyncClient": "hvac.v1.AsyncClient",
+    "Client": "hvac.v1.Client",
+}
+
+__all__ = ("AsyncClient", "Client")
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from hvac.api.secrets_engines import Ssh
+
+
+class StubAdapter:
+    """Minimal async adapter recording every request it performs."""
+
+    def __init__(self, fail_on=None, delay=0):
+        self.requests = []
+        self.active = 0
+        self.peak_active = 0
+        self.fail_on = fail_on
+        self.delay = delay
+
+    async def _record(self, method, url):
+        self.requests.append((method, url))
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if self.fail_on is not None and self.fail_on in url:
+            raise RuntimeError("stubbed failure for %s" % url)
+        return {"method": method, "url": url, "serial": len(self.requests)}
+
+    async def get(self, url, **kwargs):
+        return await self._record("get", url)
+
+    async def post(self, url, **kwargs):
+        return await self._record("post", url)
+
+    async def delete(self, url, **kwargs):
+        return await self._record("delete", url)
+
+
+class TestSshReadCache(IsolatedAsyncioTestCase):
+    async def test_cache_disabled_by_default(self):
+        adapter = StubAdapter()
+        ssh = Ssh(adapter=adapter)
+        await ssh.read_role(name="web")
+        await ssh.read_role(name="web")
+        self.assertEqual(len(adapter.requests), 2)
+
+    async def test_cached_read_served_within_ttl(self):
+        adapter = StubAdapter()
+        ssh = Ssh(adapter=adapter, cache_ttl=60)
+        first = await ssh.read_role(name="web")
+        second = await ssh.read_role(name="web")
+        self.assertEqual(len(adapter.requests), 1)
+        self.assertIs(first, second)
+
+    async def test_cache_entry_expires_after_ttl(self):
+        adapter = StubAdapter()
+        ssh = Ssh(adapter=adapter, cache_ttl=0.01)
+        await ssh.read_role(name="web")
+        await asyncio.sleep(0.02)
+        await ssh.read_role(name="web")
+        self.assertEqual(len(adapter.requests), 2)
+
+    async def test_mutating_call_invalidates_cache(self):
+        adapter = StubAdapter()
+        ssh = Ssh(adapter=adapter, cache_ttl=60)
+        await ssh.read_role(name="web")
+        await ssh.create_role(name="web", key_type="ca")
+        await ssh.read_role(name="web")
+        get_requests = [request for request in adapter.requests if request[0] == "get"]
+        self.assertEqual(len(get_requests), 2)
+
+    async def test_cache_keys_include_mount_point(self):
+        adapter = StubAdapter()
+        ssh = Ssh(adapter=adapter, cache_ttl=60)
+        await ssh.read_role(name="web", mount_point="ssh")
+        await ssh.read_role(name="web", mount_point="other-ssh")
+        self.assertEqual(len(adapter.requests), 2)
+
+
+class TestSshSingleFlight(IsolatedAsyncioTestCase):
+    async def test_concurrent_reads_share_one_request(self):
+        adapter = StubAdapter(delay=0.01)
+        ssh = Ssh(adapter=adapter)
+        responses = await asyncio.gather(
+            ssh.read_public_key(),
+            ssh.read_public_key(),
+            ssh.read_public_key(),
+        )
+        self.assertEqual(len(adapter.requests), 1)
+        self.assertEqual(responses[0], responses[1])
+        self.assertEqual(responses[0], responses[2])
+
+    async def test_cancelled_waiter_does_not_abort_shared_request(self):
+        adapter = StubAdapter(delay=0.01)
+        ssh = Ssh(adapter=adapter, cache_ttl=60)
+        leader = asyncio.ensure_future(ssh.read_public_key())
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(ssh.read_public_key())
+        await asyncio.sleep(0)
+        leader.cancel()
+        response = await follower
+        self.assertEqual(len(adapter.requests), 1)
+        self.assertEqual(response["method"], "get")
+        # The shared request also fed the cache despite the leader's cancellation.
+        self.assertIs(await ssh.read_public_key(), response)
+        self.assertEqual(len(adapter.requests), 1)
+
+    async def test_sequential_reads_do_not_coalesce(self):
+        adapter = StubAdapter()
+        ssh = Ssh(adapter=adapter)
+        await ssh.read_public_key()
+        await ssh.read_public_key()
+        self.assertEqual(len(adapter.requests), 2)
+
+
+class TestSshBulkHelpers(IsolatedAsyncioTestCase):
+    async def test_create_roles_preserves_order(self):
+        adapter = StubAdapter()
+        ssh = Ssh(adapter=adapter)
+        roles = [{"name": "role-%d" % index} for index in range(5)]
+        responses = await ssh.create_roles(roles=roles)
+        self.assertEqual(len(responses), 5)
+        for index, response in enumerate(responses):
+            self.assertTrue(response["url"].endswith("/roles/role-%d" % index))
+
+    async def test_create_roles_bounds_concurrency(self):
+        adapter = StubAdapter(delay=0.01)
+        ssh = Ssh(adapter=adapter)
+        roles = [{"name": "role-%d" % index} for index in range(12)]
+        await ssh.create_roles(roles=roles, concurrency=3)
+        self.assertEqual(len(adapter.requests), 12)
+        self.assertLessEqual(adapter.peak_active, 3)
+
+    async def test_create_roles_failure_cancels_remaining(self):
+        adapter = StubAdapter(fail_on="role-2", delay=0.01)
+        ssh = Ssh(adapter=adapter)
+        roles = [{"name": "role-%d" % index} for index in range(20)]
+        with self.assertRaises(RuntimeError):
+            await ssh.create_roles(roles=roles, concurrency=2)
+        self.assertLess(len(adapter.requests), 20)
+
+    async def test_sign_ssh_keys_signs_each_key(self):
+        adapter = StubAdapter()
+        ssh = Ssh(adapter=adapter)
+        responses = await ssh.sign_ssh_keys(
+            name="web",
+            public_keys=["ssh-rsa one", "ssh-rsa two"],
+        )
+        self.assertEqual(len(responses), 2)
+        for method, url in adapter.requests:
+            self.assertEqual(method, "post")
+            self.assertTrue(url.endswith("/sign/web"))